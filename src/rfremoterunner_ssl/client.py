@@ -80,6 +80,7 @@ class RemoteFrameworkClient:
         self._dependencies = {}
         self._pip_dependencies = {}
         self._suites = {}
+        self._suite_paths = {}
         logger.setLevel(logging.DEBUG if debug else logging.INFO)
 
     def execute_run(
@@ -119,6 +120,7 @@ class RemoteFrameworkClient:
 
         # Now iterate the suite's family tree, pull out the suites with test cases and resolve their dependencies.
         # Package them up into a dictionary that can be serialized
+        self._suite_paths = {}
         self._package_suite_hierarchy(suite)
 
         # Make the RPC but do not disclose user/pw to the log file
@@ -223,7 +225,7 @@ class RemoteFrameworkClient:
         """
         logger.debug(f"Processing Test Suite: {suite.name}")
         # Traverse the suite's ancestry to work out the directory path so that it can be recreated on the remote side
-        path = calculate_ts_parent_path(suite)
+        path = calculate_ts_parent_path(suite, self._suite_paths)
 
         # Recursively parse and process all dependencies and return the patched test suite file
         updated_file = self._process_robot_file(suite)
@@ -339,45 +341,21 @@ if __name__ == "__main__":
     # original parser's behavior, meaning that e.g. if the user has
     # specified multiple include tags, our parameter's value will
     # be a colon-separated string and no longer a list item
-    (
-        robot_log_level,
-        robot_suite,
-        robot_test,
-        robot_include,
-        robot_exclude,
-        robot_debug,
-        robot_host,
-        robot_port,
-        robot_user,
-        robot_pass,
-        robot_test_connection,
-        robot_output_dir,
-        robot_input_dir,
-        robot_extension,
-        robot_output_file,
-        robot_log_file,
-        robot_report_file,
-        robot_client_enforces_server_package_upgrade,
-    ) = get_command_line_params_client()
+    params = get_command_line_params_client()
 
     logger.info(msg=f"robotframework-remoterunner-ssl: client init ....")
 
-    # Set debug level
-    level = logging.DEBUG if robot_debug else logging.INFO
-    logging.basicConfig(
-        level=level, format="%(asctime)s %(module)s -%(levelname)s- %(message)s"
-    )
-
     # Create our future https connection string
     remote_connect_string = (
-        f"https://{robot_user}:{robot_pass}@{robot_host}:{robot_port}"
+        f"https://{params.robot_user}:{params.robot_pass}"
+        f"@{params.robot_host}:{params.robot_port}"
     )
 
     # Check if user wants to execute plain connection test
     # If yes, connect to the server and execute the test method
     # Returns simple "ok" string if SSL connection was ok and
     # client user/pw matched server user/pw
-    if robot_test_connection:
+    if params.robot_test_connection:
         p = ServerProxy(remote_connect_string)
         _, host_port = remote_connect_string.split("@")
         logger.info(msg=f"Connecting to: {host_port}")
@@ -393,6 +371,13 @@ if __name__ == "__main__":
             raise
         sys.exit(0)
 
+    robot_input_dir = params.robot_input_dir
+    robot_include = params.robot_include
+    robot_exclude = params.robot_exclude
+    robot_suite = params.robot_suite
+    robot_test = params.robot_test
+    robot_extension = params.robot_extension
+
     # prepare the expected data types for the original robotframework-remoterunner core
     # convert input directory to list item if just one item was present
     if isinstance(robot_input_dir, str):
@@ -423,8 +408,8 @@ if __name__ == "__main__":
     robot_args = {}
 
     # Add the parameters whereas present
-    if robot_log_level:
-        robot_args["loglevel"] = robot_log_level
+    if params.robot_log_level:
+        robot_args["loglevel"] = params.robot_log_level
     if robot_include:
         robot_args["include"] = robot_include
     if robot_exclude:
@@ -439,8 +424,8 @@ if __name__ == "__main__":
     # Default branch for executing actual tests
     rfs = RemoteFrameworkClient(
         remote_connect_string=remote_connect_string,
-        client_enforces_server_package_upgrade=robot_client_enforces_server_package_upgrade,
-        debug=robot_debug,
+        client_enforces_server_package_upgrade=params.robot_client_enforces_server_package_upgrade,
+        debug=params.robot_debug,
     )
     result = rfs.execute_run(
         suite_list=robot_input_dir,
@@ -456,7 +441,7 @@ if __name__ == "__main__":
         logger.info(msg="\nRobot execution response:")
         logger.info(msg=result.get("std_out_err"))
 
-        output_dir = robot_output_dir
+        output_dir = params.robot_output_dir
         if not os.path.exists(output_dir):
             logger.info(
                 msg=f"Output directory {output_dir} does not exist; creating it for the user"
@@ -466,7 +451,7 @@ if __name__ == "__main__":
         # Write the log html, report html, output xml
         if result.get("output_xml"):
             output_xml_path = resolve_output_path(
-                filename=robot_output_file, output_dir=robot_output_dir
+                filename=params.robot_output_file, output_dir=output_dir
             )
             write_file_to_disk(
                 output_xml_path, result["output_xml"].data.decode("utf-8")
@@ -475,14 +460,14 @@ if __name__ == "__main__":
 
         if result.get("log_html"):
             log_html_path = resolve_output_path(
-                filename=robot_log_file, output_dir=robot_output_dir
+                filename=params.robot_log_file, output_dir=output_dir
             )
             write_file_to_disk(log_html_path, result["log_html"].data.decode("utf-8"))
             logger.info(f"Local Log:     {log_html_path}")
 
         if result.get("report_html"):
             report_html_path = resolve_output_path(
-                filename=robot_report_file, output_dir=robot_output_dir
+                filename=params.robot_report_file, output_dir=output_dir
             )
             write_file_to_disk(
                 report_html_path, result["report_html"].data.decode("utf-8")
@@ -51,15 +51,13 @@ from rfremoterunner_ssl.utils import (
     read_file_from_disk,
     get_command_line_params_server,
     check_for_pip_package_condition,
+    clear_pip_package_cache,
 )
 import shutil
 import subprocess
 import pkg_resources
 
 # Set up the global logger variable
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s %(module)s -%(levelname)s- %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 # static stuff
@@ -178,6 +176,10 @@ class RobotFrameworkServer:
             if len(pip_dependencies) > 0 and robot_upgrade_server_packages != "NEVER":
                 logger.info(msg="Starting pip packages installation process ...")
 
+                # Only reuse PyPi package information within this run; otherwise
+                # a long-running server would never see newer PyPi releases
+                clear_pip_package_cache()
+
                 # get the installed pips
                 installed_pips = {pkg.key for pkg in pkg_resources.working_set}
                 pips_to_be_installed = []
@@ -649,37 +651,37 @@ class MyXMLRPCServer(CustomThreadingMixIn, SimpleXMLRPCServer):
 
 def run_server():
     # Get our command line parameters
-    (
-        robot_log_level,
-        robot_debug,
-        robot_host,
-        robot_port,
-        robot_user,
-        robot_pass,
-        robot_keyfile,
-        robot_certfile,
-        upgrade_server_packages,
-    ) = get_command_line_params_server()
+    params = get_command_line_params_server()
 
     global robot_upgrade_server_packages
-    robot_upgrade_server_packages = upgrade_server_packages
+    robot_upgrade_server_packages = params.robot_upgrade_server_packages
 
     # Check if the keyfile exists
-    if not os.path.isfile(robot_keyfile):
-        logger.info(msg=f"Keyfile '{robot_keyfile}' does not exist!")
+    if not os.path.isfile(params.robot_keyfile):
+        logger.info(msg=f"Keyfile '{params.robot_keyfile}' does not exist!")
         sys.exit(0)
 
     # Check if the certfile exists
-    if not os.path.isfile(robot_certfile):
-        logger.info(msg=f"Certfile '{robot_certfile}' does not exist!")
+    if not os.path.isfile(params.robot_certfile):
+        logger.info(msg=f"Certfile '{params.robot_certfile}' does not exist!")
 
-    os.environ.setdefault("REQUESTS_CA_BUNDLE", str(Path(robot_keyfile).absolute()))
-    os.environ.setdefault("SSL_CERT_FILE", str(Path(robot_certfile).absolute()))
+    os.environ.setdefault(
+        "REQUESTS_CA_BUNDLE", str(Path(params.robot_keyfile).absolute())
+    )
+    os.environ.setdefault(
+        "SSL_CERT_FILE", str(Path(params.robot_certfile).absolute())
+    )
 
     # Server init
     logger.info(msg=f"robotframework-remoterunner-ssl: server init ....")
 
-    server = MyXMLRPCServer(host=robot_host, port=robot_port, robot_user=robot_user, robot_pass=robot_pass, logRequests=True)
+    server = MyXMLRPCServer(
+        host=params.robot_host,
+        port=params.robot_port,
+        robot_user=params.robot_user,
+        robot_pass=params.robot_pass,
+        logRequests=True,
+    )
     # Run the server's main loop
     sa = server.socket.getsockname()
     logger.info(
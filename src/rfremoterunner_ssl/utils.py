@@ -24,28 +24,143 @@
 # 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 #
 
-from io import open
 import os
+import posixpath
+import mmap
+import re
+import sys
 import argparse
-from johnnydep.lib import JohnnyDist
-import structlog
+from typing import NamedTuple
+from importlib import metadata
+from pathlib import Path
 from packaging import version
 import operator
 import logging
+import functools
 
 # Set up the global logger variable
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s %(module)s -%(levelname)s- %(message)s"
-)
 logger = logging.getLogger(__name__)
 
-PORT_INC_REGEX = ".*:[0-9]{1,5}$"
+# matches a trailing port number, e.g. "localhost:8111"; use with search()
+PORT_INC_RE = re.compile(r":[0-9]{1,5}$")
 
-# only used by package 'johnnydep'; remove this line if you
-# want to receive the full set of debug information
-structlog.configure(
-    wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
-)
+# valid values for the command line's log level and pip upgrade options
+_LOG_LEVELS = frozenset({"TRACE", "DEBUG", "INFO", "WARN", "NONE"})
+_UPGRADE_MODES = frozenset({"NEVER", "OUTDATED", "ALWAYS"})
+
+# pip version compare operators and their comparison functions
+_OPERATORS = {
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# files larger than this (in bytes) are read via mmap
+MMAP_THRESHOLD = 1 << 20
+
+_structlog_configured = False
+
+
+class ServerArgs(NamedTuple):
+    """
+    Command line parameters of the server
+    """
+
+    robot_log_level: str
+    robot_debug: bool
+    robot_host: str
+    robot_port: int
+    robot_user: str
+    robot_pass: str
+    robot_keyfile: str
+    robot_certfile: str
+    robot_upgrade_server_packages: str
+
+
+class ClientArgs(NamedTuple):
+    """
+    Command line parameters of the client
+    """
+
+    robot_log_level: str
+    robot_suite: list
+    robot_test: list
+    robot_include: list
+    robot_exclude: list
+    robot_debug: bool
+    robot_host: str
+    robot_port: int
+    robot_user: str
+    robot_pass: str
+    robot_test_connection: bool
+    robot_output_dir: str
+    robot_input_dir: list
+    robot_extension: list
+    robot_output_file: str
+    robot_log_file: str
+    robot_report_file: str
+    robot_client_enforces_server_package_upgrade: bool
+
+
+class _ServerNamespace(argparse.Namespace):
+    """
+    argparse namespace which stores the server parameters in slots
+    """
+
+    __slots__ = ServerArgs._fields
+
+
+class _ClientNamespace(argparse.Namespace):
+    """
+    argparse namespace which stores the client parameters in slots
+    """
+
+    __slots__ = ClientArgs._fields
+
+
+def _configure_logging(debug: bool = False):
+    """
+    Configures the root logger. Only called by the command line entry points
+    so that merely importing this module does not change the logging setup
+
+    Parameters
+    ==========
+    debug: 'bool'
+        True: enable debug logging
+    Returns
+    =======
+    """
+    logging.basicConfig(
+        level=logging.DEBUG if debug else logging.INFO,
+        format="%(asctime)s %(module)s -%(levelname)s- %(message)s",
+    )
+
+
+def _configure_structlog():
+    """
+    Configures structlog (which is only used by package 'johnnydep').
+    structlog is imported on first use as its import is expensive and
+    only required for pip package checks
+
+    Parameters
+    ==========
+    Returns
+    =======
+    """
+    global _structlog_configured
+    if _structlog_configured:
+        return
+
+    import structlog
+
+    # remove this call if you want to receive the full set of debug information
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+    )
+    _structlog_configured = True
 
 
 def read_file_from_disk(path, encoding="utf-8", into_lines=False):
@@ -66,8 +181,23 @@ def read_file_from_disk(path, encoding="utf-8", into_lines=False):
     contents : 'str'
         Contents of the file
     """
-    with open(path, "r", encoding=encoding) as file_handle:
-        return file_handle.readlines() if into_lines else file_handle.read()
+    if into_lines:
+        with open(path, "r", encoding=encoding) as file_handle:
+            return file_handle.readlines()
+
+    # Large files (e.g. Robot Framework's log and output files) are decoded
+    # straight from a memory mapped file, saving a full copy of the file data
+    if os.path.getsize(path) > MMAP_THRESHOLD:
+        with open(path, "rb") as file_handle, mmap.mmap(
+            file_handle.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped_file:
+            contents = str(mapped_file, encoding)
+        # mimic the universal newline handling of text mode reads
+        if "\r" in contents:
+            contents = contents.replace("\r\n", "\n").replace("\r", "\n")
+        return contents
+
+    return Path(path).read_text(encoding=encoding)
 
 
 def write_file_to_disk(path, file_contents, encoding="utf-8"):
@@ -86,11 +216,12 @@ def write_file_to_disk(path, file_contents, encoding="utf-8"):
     Returns
     =======
     """
-    with open(path, "w", encoding=encoding) as file_handle:
-        file_handle.write(str(file_contents))
+    if not isinstance(file_contents, str):
+        file_contents = str(file_contents)
+    Path(path).write_text(file_contents, encoding=encoding)
 
 
-def calculate_ts_parent_path(suite):
+def calculate_ts_parent_path(suite, cache: dict = None):
     """
     Parses up a test suite's ancestry and builds up a file path. This will then be used to create the correct test
     suite hierarchy on the remote host
@@ -99,23 +230,30 @@ def calculate_ts_parent_path(suite):
     ==========
     suite: 'robot.running.model.TestSuite'
         test suite to parse the ancestry for
+    cache: 'dict'
+        Optional cache for the file paths of already processed parent suites,
+        keyed by the parent suite's id(). Must not outlive the test suites
 
     Returns
     =======
     file_path : 'str'
         file path of where the given suite is relative to the root test suite
     """
-    family_tree = []
-
-    if not suite.parent:
+    parent = suite.parent
+    if not parent:
         return ""
-    current_suite = suite.parent
-    while current_suite:
-        family_tree.append(current_suite.name)
-        current_suite = current_suite.parent
+
+    if cache is not None and id(parent) in cache:
+        return cache[id(parent)]
+
+    parent_path = calculate_ts_parent_path(parent, cache)
 
     # Stick with unix style slashes for consistency
-    return os.path.join(*reversed(family_tree)).replace("\\", "/")
+    file_path = posixpath.join(parent_path, parent.name)
+
+    if cache is not None:
+        cache[id(parent)] = file_path
+    return file_path
 
 
 def resolve_output_path(filename: str, output_dir: str):
@@ -134,22 +272,25 @@ def resolve_output_path(filename: str, output_dir: str):
     filename : 'str'
         Absolute path of where to save the test artifact
     """
-    ret_val = filename
+    if os.path.isabs(filename):
+        return os.path.normpath(filename)
 
-    if not os.path.isabs(filename):
-        ret_val = os.path.abspath(os.path.join(output_dir, filename))
+    # abspath already normalizes the path
+    return os.path.abspath(os.path.join(output_dir, filename))
 
-    return os.path.normpath(ret_val)
 
-
-def get_command_line_params_server():
+@functools.lru_cache(maxsize=1)
+def _build_server_parser():
     """
-    Function which gets the command line params from the user
+    Builds the server's command line parser. The parser is only
+    built once and then reused
+
     Parameters
     ==========
     Returns
     =======
-    all parameters that the user has specified
+    parser : 'argparse.ArgumentParser'
+        command line parser for the server
     """
     parser = argparse.ArgumentParser()
 
@@ -203,7 +344,7 @@ def get_command_line_params_server():
 
     parser.add_argument(
         "--log-level",
-        choices={"TRACE", "DEBUG", "INFO", "WARN", "NONE"},
+        choices=_LOG_LEVELS,
         default="WARN",
         type=str.upper,
         dest="robot_log_level",
@@ -212,7 +353,7 @@ def get_command_line_params_server():
 
     parser.add_argument(
         "--upgrade-server-packages",
-        choices={"NEVER", "OUTDATED", "ALWAYS"},
+        choices=_UPGRADE_MODES,
         default="NEVER",
         type=str.upper,
         dest="robot_upgrade_server_packages",
@@ -233,29 +374,23 @@ def get_command_line_params_server():
         help="Enables debug logging and will not delete the temporary directory after a robot run",
     )
 
-    args = parser.parse_args()
-
-    robot_log_level = args.robot_log_level
-    robot_debug = args.robot_debug
-    robot_host = args.robot_host
-    robot_port = args.robot_port
-    robot_user = args.robot_user
-    robot_pass = args.robot_pass
-    robot_keyfile = args.robot_keyfile
-    robot_certfile = args.robot_certfile
-    robot_upgrade_server_packages = args.robot_upgrade_server_packages
-
-    return (
-        robot_log_level,
-        robot_debug,
-        robot_host,
-        robot_port,
-        robot_user,
-        robot_pass,
-        robot_keyfile,
-        robot_certfile,
-        robot_upgrade_server_packages,
-    )
+    return parser
+
+
+def get_command_line_params_server():
+    """
+    Function which gets the command line params from the user
+    Parameters
+    ==========
+    Returns
+    =======
+    params: 'ServerArgs'
+        all parameters that the user has specified
+    """
+    args = _build_server_parser().parse_args(namespace=_ServerNamespace())
+    _configure_logging(debug=args.robot_debug)
+
+    return ServerArgs._make(getattr(args, field) for field in ServerArgs._fields)
 
 
 def check_if_input_dir_exists(dir: str):
@@ -277,16 +412,21 @@ def check_if_input_dir_exists(dir: str):
         return dir
 
 
-def get_command_line_params_client():
+@functools.lru_cache(maxsize=1)
+def _build_client_common_parser():
     """
-    Function which gets the command line params from the user
+    Builds the parser for the client's command line arguments which are
+    required by both the connection test and the actual robot run.
+    The parser is only built once and then reused
+
     Parameters
     ==========
     Returns
     =======
-    all parameters that the user has specified
+    parser : 'argparse.ArgumentParser'
+        parent parser with the common client arguments
     """
-    parser = argparse.ArgumentParser()
+    parser = argparse.ArgumentParser(add_help=False)
 
     parser.add_argument(
         "--test-connection",
@@ -331,7 +471,7 @@ def get_command_line_params_client():
 
     parser.add_argument(
         "--log-level",
-        choices={"TRACE", "DEBUG", "INFO", "WARN", "NONE"},
+        choices=_LOG_LEVELS,
         default="WARN",
         type=str.upper,
         dest="robot_log_level",
@@ -341,176 +481,251 @@ def get_command_line_params_client():
     )
 
     parser.add_argument(
-        "--suite",
-        action="extend",
-        nargs="+",
-        dest="robot_suite",
-        type=str,
-        help="Select test suites to run by name. When this option is used with --test, --include or --exclude, "
-        "only test cases in matching suites and also matching other filtering criteria are selected. Name can be "
-        "a simple pattern similarly as with --test and it can contain parent name separated with a dot. You can "
-        "specify this parameter multiple times, if necessary.",
+        "--debug",
+        dest="robot_debug",
+        action="store_true",
+        help="Run in debug mode. This will enable debug logging and does not cleanup the workspace directory on the "
+        "remote machine after test execution",
     )
 
-    parser.add_argument(
-        "--test",
-        action="extend",
-        nargs="+",
-        dest="robot_test",
-        type=str,
-        help="Select test cases to run by name or long name. Name is case insensitive and it can also be a simple "
-        "pattern where `*` matches anything and `?` matches any char. You can specify this parameter multiple "
-        "times, if necessary.",
-    )
+    return parser
 
-    parser.add_argument(
-        "--include",
-        action="extend",
-        nargs="+",
-        dest="robot_include",
-        type=str,
-        help="Select test cases to run by tag. Similarly as name with --test, tag is case and space insensitive and "
-        "it is possible to use patterns with `*` and `?` as wildcards. Tags and patterns can also be combined "
-        "together with `AND`, `OR`, and `NOT` operators. Examples: --include foo, --include bar*, "
-        "--include fooANDbar*",
-    )
 
-    parser.add_argument(
-        "--exclude",
-        action="extend",
-        nargs="+",
-        dest="robot_exclude",
-        type=str,
-        help="Select test cases not to run by tag. These tests are not run even if included with --include. Tags are "
-        "matched using the rules explained with --include.",
-    )
+@functools.lru_cache(maxsize=2)
+def _build_client_parser(test_connection: bool):
+    """
+    Builds the client's command line parser. The arguments for the
+    actual robot run are only added if we do not run a connection test.
+    The parser is only built once per mode and then reused
 
-    parser.add_argument(
-        "--extension",
-        action="extend",
-        nargs="+",
-        dest="robot_extension",
-        type=str,
-        help="Parse only files with this extension when executing a directory. Has no effect when running individual "
-        "files or when using resource files. You can specify this parameter multiple times, if necessary. "
-        "Specify the value without leading '.'. Example: `--extension robot`. Default extensions: robot, text, "
-        "txt, resource",
-    )
+    Parameters
+    ==========
+    test_connection : 'bool'
+        True: build the parser for the connection test
+    Returns
+    =======
+    parser : 'argparse.ArgumentParser'
+        command line parser for the client
+    """
+    parser = argparse.ArgumentParser(parents=[_build_client_common_parser()])
+
+    if test_connection:
+        # the robot run settings are irrelevant for a connection test
+        parser.set_defaults(
+            robot_suite=None,
+            robot_test=None,
+            robot_include=None,
+            robot_exclude=None,
+            robot_extension=None,
+            robot_output_dir=None,
+            robot_input_dir=None,
+            robot_output_file=None,
+            robot_log_file=None,
+            robot_report_file=None,
+            robot_client_enforces_server_package_upgrade=False,
+        )
+    else:
+        parser.add_argument(
+            "--suite",
+            action="extend",
+            nargs="+",
+            dest="robot_suite",
+            type=str,
+            help="Select test suites to run by name. When this option is used with --test, --include or --exclude, "
+            "only test cases in matching suites and also matching other filtering criteria are selected. Name can be "
+            "a simple pattern similarly as with --test and it can contain parent name separated with a dot. You can "
+            "specify this parameter multiple times, if necessary.",
+        )
 
-    parser.add_argument(
-        "--output-dir",
-        dest="robot_output_dir",
-        type=str,
-        default=".",
-        help="Output directory which will host your output files. If a nonexisting dictionary is specified, "
-        "it will be created for you. Default value: current directory",
-    )
+        parser.add_argument(
+            "--test",
+            action="extend",
+            nargs="+",
+            dest="robot_test",
+            type=str,
+            help="Select test cases to run by name or long name. Name is case insensitive and it can also be a simple "
+            "pattern where `*` matches anything and `?` matches any char. You can specify this parameter multiple "
+            "times, if necessary.",
+        )
 
-    parser.add_argument(
-        "--input-dir",
-        dest="robot_input_dir",
-        action="extend",
-        nargs="+",
-        type=check_if_input_dir_exists,
-        help="Input directory (containing your robot tests). You can specify this parameter multiple times, "
-        "if necessary. Default value: current directory",
-    )
+        parser.add_argument(
+            "--include",
+            action="extend",
+            nargs="+",
+            dest="robot_include",
+            type=str,
+            help="Select test cases to run by tag. Similarly as name with --test, tag is case and space insensitive and "
+            "it is possible to use patterns with `*` and `?` as wildcards. Tags and patterns can also be combined "
+            "together with `AND`, `OR`, and `NOT` operators. Examples: --include foo, --include bar*, "
+            "--include fooANDbar*",
+        )
 
-    parser.add_argument(
-        "--output-file",
-        dest="robot_output_file",
-        type=str,
-        default="remote_output.xml",
-        help="Robot Framework output file name. Default value: remote_output.xml",
-    )
+        parser.add_argument(
+            "--exclude",
+            action="extend",
+            nargs="+",
+            dest="robot_exclude",
+            type=str,
+            help="Select test cases not to run by tag. These tests are not run even if included with --include. Tags are "
+            "matched using the rules explained with --include.",
+        )
 
-    parser.add_argument(
-        "--log-file",
-        dest="robot_log_file",
-        type=str,
-        default="remote_log.html",
-        help="Robot Framework log file name. Default value: remote_log.html",
-    )
-    parser.add_argument(
-        "--report-file",
-        dest="robot_report_file",
-        type=str,
-        default="remote_report.html",
-        help="Robot Framework report file name. Default value: remote_report.html",
-    )
+        parser.add_argument(
+            "--extension",
+            action="extend",
+            nargs="+",
+            dest="robot_extension",
+            type=str,
+            help="Parse only files with this extension when executing a directory. Has no effect when running individual "
+            "files or when using resource files. You can specify this parameter multiple times, if necessary. "
+            "Specify the value without leading '.'. Example: `--extension robot`. Default extensions: robot, text, "
+            "txt, resource",
+        )
 
-    parser.add_argument(
-        "--client-enforces-server-package-upgrade",
-        dest="robot_client_enforces_server_package_upgrade",
-        action="store_true",
-        help="If your Robot Framework suite depends on external pip packages, enabling this switch results in "
-        "always upgrading these packages"
-        " on the remote XMLRPC server even if they are already installed. This is the equivalent to the"
-        " server's 'upgrade-server-packages=ALWAYS' option which allows you to control a forced update through"
-        " the client. Note that the server can still disable upgrades completely by setting its 'upgrade-server-packages'"
-        " option to 'NEVER'",
-    )
+        parser.add_argument(
+            "--output-dir",
+            dest="robot_output_dir",
+            type=str,
+            default=".",
+            help="Output directory which will host your output files. If a nonexisting dictionary is specified, "
+            "it will be created for you. Default value: current directory",
+        )
+
+        parser.add_argument(
+            "--input-dir",
+            dest="robot_input_dir",
+            action="extend",
+            nargs="+",
+            type=check_if_input_dir_exists,
+            help="Input directory (containing your robot tests). You can specify this parameter multiple times, "
+            "if necessary. Default value: current directory",
+        )
+
+        parser.add_argument(
+            "--output-file",
+            dest="robot_output_file",
+            type=str,
+            default="remote_output.xml",
+            help="Robot Framework output file name. Default value: remote_output.xml",
+        )
+
+        parser.add_argument(
+            "--log-file",
+            dest="robot_log_file",
+            type=str,
+            default="remote_log.html",
+            help="Robot Framework log file name. Default value: remote_log.html",
+        )
+
+        parser.add_argument(
+            "--report-file",
+            dest="robot_report_file",
+            type=str,
+            default="remote_report.html",
+            help="Robot Framework report file name. Default value: remote_report.html",
+        )
+
+        parser.add_argument(
+            "--client-enforces-server-package-upgrade",
+            dest="robot_client_enforces_server_package_upgrade",
+            action="store_true",
+            help="If your Robot Framework suite depends on external pip packages, enabling this switch results in "
+            "always upgrading these packages"
+            " on the remote XMLRPC server even if they are already installed. This is the equivalent to the"
+            " server's 'upgrade-server-packages=ALWAYS' option which allows you to control a forced update through"
+            " the client. Note that the server can still disable upgrades completely by setting its 'upgrade-server-packages'"
+            " option to 'NEVER'",
+        )
+
+    return parser
+
+
+def get_command_line_params_client():
+    """
+    Function which gets the command line params from the user
+    Parameters
+    ==========
+    Returns
+    =======
+    params: 'ClientArgs'
+        all parameters that the user has specified
+    """
+    # Only build the robot run arguments if we need them
+    test_connection = "--test-connection" in sys.argv[1:]
+    parser = _build_client_parser(test_connection=test_connection)
 
-    parser.add_argument(
-        "--debug",
-        dest="robot_debug",
-        action="store_true",
-        help="Run in debug mode. This will enable debug logging and does not cleanup the workspace directory on the "
-        "remote machine after test execution",
-    )
     # run the parser
-    args = parser.parse_args()
-
-    # assign values to target variables and return
-    # them back to the user
-    robot_log_level = args.robot_log_level
-    robot_suite = args.robot_suite
-    robot_test = args.robot_test
-    robot_include = args.robot_include
-    robot_exclude = args.robot_exclude
-    robot_debug = args.robot_debug
-    robot_host = args.robot_host
-    robot_port = args.robot_port
-    robot_user = args.robot_user
-    robot_pass = args.robot_pass
-    robot_test_connection = args.robot_test_connection
-    robot_output_dir = args.robot_output_dir
-    robot_input_dir = args.robot_input_dir
-    robot_extension = args.robot_extension
-    robot_output_file = args.robot_output_file
-    robot_log_file = args.robot_log_file
-    robot_report_file = args.robot_report_file
-    robot_client_enforces_server_package_upgrade = (
-        args.robot_client_enforces_server_package_upgrade
-    )
+    if test_connection:
+        args, unknown_args = parser.parse_known_args(namespace=_ClientNamespace())
+        # Arguments which are unknown to the connection test are either robot
+        # run settings or typos. Let the full parser validate them
+        if unknown_args:
+            args = _build_client_parser(test_connection=False).parse_args(
+                namespace=_ClientNamespace()
+            )
+    else:
+        args = parser.parse_args(namespace=_ClientNamespace())
+    _configure_logging(debug=args.robot_debug)
+
+    params = ClientArgs._make(getattr(args, field) for field in ClientArgs._fields)
 
     # populate defaults in case the user has not specified a value
     # obviously, argparse's 'extend' option does not permit defaults
-    robot_input_dir = "." if not robot_input_dir else robot_input_dir
-    robot_extension = (
-        ["robot", "txt", "text", "resource"] if not robot_extension else robot_extension
+    return params._replace(
+        robot_input_dir=params.robot_input_dir or ".",
+        robot_extension=params.robot_extension
+        or ["robot", "txt", "text", "resource"],
     )
 
-    return (
-        robot_log_level,
-        robot_suite,
-        robot_test,
-        robot_include,
-        robot_exclude,
-        robot_debug,
-        robot_host,
-        robot_port,
-        robot_user,
-        robot_pass,
-        robot_test_connection,
-        robot_output_dir,
-        robot_input_dir,
-        robot_extension,
-        robot_output_file,
-        robot_log_file,
-        robot_report_file,
-        robot_client_enforces_server_package_upgrade,
-    )
+
+@functools.lru_cache(maxsize=256)
+def _get_dist_info(package_name: str):
+    """
+    Helper method which requests the pip package information from PyPi.
+    As this involves a network lookup, results are cached per package
+    name (including failed lookups)
+
+    Parameters
+    ==========
+    package_name : 'str'
+            Pip package name as listed on PyPi, excluding version info
+    Returns
+    =======
+    distribution : 'JohnnyDist'
+            Pip package information
+            None: package is unavailable on PyPi
+    """
+    # johnnydep pulls in a large dependency tree; only import it on demand
+    from johnnydep.lib import JohnnyDist
+
+    try:
+        logger.debug("Requesting pip info for package '%s'", package_name)
+        distribution = JohnnyDist(req_string=package_name)
+    except Exception as ex:
+        logger.debug(
+            "Pip package check: package '%s' unavailable on PyPi: %s", package_name, ex
+        )
+        return None
+    logger.debug("Pip info for package '%s' successfully requested", package_name)
+    return distribution
+
+
+# version strings are parsed over and over again for the same packages
+_parse_version = functools.lru_cache(maxsize=1024)(version.parse)
+
+
+def clear_pip_package_cache():
+    """
+    Discards all cached PyPi package information. Call this method
+    prior to each pip package check run so that the information does
+    not get outdated
+
+    Parameters
+    ==========
+    Returns
+    =======
+    """
+    _get_dist_info.cache_clear()
 
 
 def check_for_pip_package_condition(
@@ -532,47 +747,63 @@ def check_for_pip_package_condition(
     return_value : 'object'
             True/False: comparison was successsful/not successful
             None: error has occurred
+
+    Raises
+    ======
+    ValueError
+            compare_operator is not a supported pip compare operator
     """
 
-    assert compare_operator in [">", ">=", "<", "<=", "!=", "=="]
+    # Run all cheap checks prior to the (expensive) PyPi lookup
+    if compare_operator not in _OPERATORS:
+        raise ValueError(f"Invalid pip compare operator '{compare_operator}'")
+
+    # Check if the user has provided a specific version for comparison reasons
+    # If that is the case, use this version instead of the latest one from PyPi
+    # and do NOT perform a PyPi lookup.
+    use_specific_version = bool(
+        specific_version and specific_version.lower() != "latest"
+    )
+    if use_specific_version:
+        try:
+            _parse_version(specific_version)
+        except version.InvalidVersion:
+            logger.debug(
+                "Requested version '%s' of Pip package '%s' is invalid",
+                specific_version,
+                package_name,
+            )
+            return None
 
-    distribution = current = latest = None
+    # get the installed version from the local environment - we should
+    # already know that this package is installed
     try:
-        logger.debug(msg=f"Requesting pip info for package '{package_name}'")
-        distribution = JohnnyDist(req_string=package_name)
-    except:
-        logger.debug(
-            msg=f"Pip package check: package '{package_name}' unavailable on PyPi"
-        )
+        installed = metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        logger.debug("Pip package '%s' is not installed", package_name)
         return None
-    if distribution:
-        logger.debug(
-            msg=f"Pip info for package '{package_name}' successfully requested"
-        )
-        # get the installed version - this should never cause an error as we
-        # already know that this package is installed
-        installed = distribution.version_installed
-        logger.debug(
-            msg=f"Installed version of Pip package '{package_name}': {installed}"
-        )
+    logger.debug("Installed version of Pip package '%s': %s", package_name, installed)
 
-        # Check if the user has provided a specific version for comparison reasons
-        # If that is the case, use this version instead of the latest one from PyPi
-        # and do NOT perform a PyPi lookup.
-        if specific_version and specific_version.lower() != "latest":
-            latest = specific_version
-            logger.debug(
-                msg=f"Requested version of Pip package '{package_name}': {installed}"
-            )
-        else:
-            # Try to get the latest remote version from PyPi
+    latest = None
+    if use_specific_version:
+        latest = specific_version
+        logger.debug("Requested version of Pip package '%s': %s", package_name, latest)
+    else:
+        # Only now that we need the latest version, perform the PyPi lookup
+        _configure_structlog()
+        distribution = _get_dist_info(package_name)
+        if distribution:
             try:
                 latest = distribution.version_latest
                 logger.debug(
-                    msg=f"Latest version of Pip package '{package_name}': {installed}"
+                    "Latest version of Pip package '%s': %s", package_name, latest
+                )
+            except Exception as ex:
+                logger.debug(
+                    "Unable to get latest version of Pip package '%s': %s",
+                    package_name,
+                    ex,
                 )
-            except:
-                latest = None
 
     # Check if we were able to determine the versions for both the installed package
     # and the latest/requested package, otherwise return that we were unsuccessful.
@@ -580,27 +811,23 @@ def check_for_pip_package_condition(
     if not latest or not installed:
         return None
 
-    # Create a list of operators that we
-    operator_list = {
-        "<=": operator.lt,
-        "<": operator.le,
-        "==": operator.eq,
-        "!=": operator.ne,
-        ">": operator.gt,
-        ">=": operator.ge,
-    }
-
     # Parse version string to compare operator
     try:
-        installed_version = version.parse(installed)
-        latest_version = version.parse(latest)
-    except:
+        installed_version = _parse_version(installed)
+        latest_version = _parse_version(latest)
+    except version.InvalidVersion as ex:
+        logger.debug("Pip package '%s': %s", package_name, ex)
         return None
 
     # Make the comparison and return the result to the user
-    result = operator_list[compare_operator](installed_version, latest_version)
+    result = _OPERATORS[compare_operator](installed_version, latest_version)
     logger.info(
-        msg=f"Package '{package_name}' comparison: installed version '{installed}' {compare_operator} latest version '{latest}' = '{result}'"
+        "Package '%s' comparison: installed version '%s' %s latest version '%s' = '%s'",
+        package_name,
+        installed,
+        compare_operator,
+        latest,
+        result,
     )
 
     return result